@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compiled simulation kernel
+
+Run this once at build time to produce the sim_native extension module:
+    python _sim_aot.py
+sim_engine uses sim_native for batches below PARALLEL_MIN_SIMS when it can be
+imported, so those runs never import Numba. Larger batches still go to the
+multi-threaded JIT kernel, and the NumPy engine covers everything else
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('sim_native')
+
+@cc.export('simulate_all', 'f8[:,:](f8, f8, f8, i1[:,:])')
+def simulate_all(initial, heads_multiplier, tails_multiplier, flips):
+    """
+    Balance paths for every simulation from an (n_sims, years) array of coin flips.
+    Returns an (n_sims, years + 1) array of balances
+    """
+    n_sims, years = flips.shape
+    paths = np.empty((n_sims, years + 1))
+    for s in range(n_sims):
+        balance = initial
+        paths[s, 0] = balance
+        for t in range(years):
+            balance *= heads_multiplier if flips[s, t] else tails_multiplier
+            paths[s, t + 1] = balance
+    return paths
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,22 @@
+"""
+Numba JIT kernels for the simulation engine
+
+Importing this module imports Numba, so sim_engine only imports it the first
+time a batch is large enough to need it. cache=True keeps the compiled kernel
+on disk between runs
+"""
+
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def simulate_all(paths, flips, initial, up, down, n_sims, years):
+    """
+    Fill in every balance path in place, one path per thread
+    """
+    for s in prange(n_sims):
+        balance = initial
+        paths[s, 0] = balance
+        for t in range(years):
+            balance *= up if flips[s, t] else down
+            paths[s, t + 1] = balance
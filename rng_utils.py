@@ -0,0 +1,22 @@
+"""
+Shared coin flips for the investment game simulations
+"""
+
+import numpy as np
+
+
+def draw_flips(n_sims, years, seed=42):
+    """
+    Flip every coin for n_sims simulations of the given number of years.
+    Returns an (n_sims, years) int8 array (1 = heads, 0 = tails)
+
+    The same seed gives the same flips in every script, so both strategies
+    face identical coin flips and can be compared simulation by simulation
+    """
+    rng = np.random.default_rng(seed)
+
+    # Every raw 64-bit PCG64 word holds 64 fair coin flips,
+    # so one draw covers the whole experiment
+    n_flips = n_sims * years
+    raw = rng.bit_generator.random_raw((n_flips + 63) // 64)
+    return np.unpackbits(raw.view(np.uint8))[:n_flips].reshape(n_sims, years).view(np.int8)
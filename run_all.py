@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Run the single-path, original strategy and modified strategy analyses
+concurrently, one worker process per script
+"""
+
+import multiprocessing
+import os
+import runpy
+
+# The scripts and their PNGs live next to this file, wherever it is run from
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPTS = [os.path.join(BASE_DIR, name) for name in [
+    'single_sim_plot.py',
+    'multiple_simulations.py',
+    'modified_strategy_simulations.py',
+]]
+
+def init_worker():
+    """
+    Run every worker from the repository so the plots are saved there
+    """
+    os.chdir(BASE_DIR)
+
+def run_script(path):
+    """
+    Run one analysis script in this worker process.
+    Each script seeds its own generator, so no RNG state is shared with the parent
+    """
+    # Pick a non-interactive backend before pyplot is imported so workers never start a GUI
+    import matplotlib
+    matplotlib.use('Agg')
+    runpy.run_path(path, run_name='__main__')
+
+if __name__ == '__main__':
+    with multiprocessing.Pool(processes=len(SCRIPTS), initializer=init_worker) as pool:
+        pool.map(run_script, SCRIPTS)
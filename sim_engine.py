@@ -0,0 +1,256 @@
+"""
+Shared simulation engine for the investment game scripts.
+A strategy is fully described by its yearly multipliers: the balance is
+multiplied by `up` on heads and by `down` on tails
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from importlib.util import find_spec
+from math import comb
+
+import numpy as np
+
+# Numba is optional: without it the NumPy engine below is used. It is only
+# imported (and its kernel compiled) once a batch is large enough to need it
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
+# Kernel compiled ahead of time by _sim_aot.py, if it has been built
+try:
+    import sim_native
+    SIM_NATIVE_AVAILABLE = True
+except ImportError:
+    SIM_NATIVE_AVAILABLE = False
+
+# Batches at least this large are split across threads, smaller ones stay on one core
+PARALLEL_MIN_SIMS = 10_000
+
+# Outcomes that land exactly on a threshold (1.25^15 * 0.8^15 = 1) come out a
+# rounding error either side of it in floating point, so threshold comparisons
+# are made in log space with this much slack
+LOG_TOLERANCE = 1e-9
+
+
+@dataclass
+class SimResults:
+    """
+    Simulation results stored as arrays, one row per simulation.
+    Only the number of heads decides the final balance, so it is looked up
+    by head count; the year-by-year paths are only simulated when asked for
+    """
+    flips: np.ndarray   # (n_sims, years) coin flips, 1 = heads
+    ages: np.ndarray    # (years + 1,) age at each balance
+    initial: float      # starting balance
+    up: float           # multiplier on heads
+    down: float         # multiplier on tails
+
+    @property
+    def years(self):
+        return self.flips.shape[1]
+
+    @cached_property
+    def heads_count(self):
+        return self.flips.sum(axis=1)
+
+    @property
+    def tails_count(self):
+        return self.years - self.heads_count
+
+    @cached_property
+    def log_final_balances(self):
+        return log_outcome_balances(self.initial, self.years, self.up, self.down)[self.heads_count]
+
+    @cached_property
+    def final_balances(self):
+        return np.exp(self.log_final_balances)
+
+    @cached_property
+    def heads_histogram(self):
+        # Number of simulations ending with each number of heads 0..years
+        return np.bincount(self.heads_count, minlength=self.years + 1)
+
+    def count_above(self, threshold):
+        """
+        Number of simulations ending strictly above the threshold
+        """
+        mask = outcomes_above(threshold, self.initial, self.years, self.up, self.down)
+        return self.heads_histogram[mask].sum()
+
+    def count_below(self, threshold):
+        """
+        Number of simulations ending strictly below the threshold
+        """
+        mask = outcomes_below(threshold, self.initial, self.years, self.up, self.down)
+        return self.heads_histogram[mask].sum()
+
+    @cached_property
+    def paths(self):
+        # (n_sims, years + 1) balances, year by year
+        return simulate_paths(self.flips, self.initial, self.up, self.down)
+
+
+def simulate_paths(flips, initial, up, down):
+    """
+    Simulate every path at once from an (n_sims, years) array of coin flips
+    (1 = heads, 0 = tails) of any integer or bool dtype.
+    Returns an (n_sims, years + 1) array of balances
+    """
+    # Every engine reads the flips as contiguous int8: the native kernel does
+    # not check dtypes and would read other arrays out of bounds, and bool
+    # flips would act as a mask instead of an index in the NumPy lookup
+    flips = np.ascontiguousarray(flips, dtype=np.int8)
+    n_sims, years = flips.shape
+
+    # Large batches go to the multi-threaded kernel. Small ones skip Numba
+    # entirely: importing it and loading the kernel costs far more than it
+    # saves at a few thousand paths
+    if NUMBA_AVAILABLE and n_sims >= PARALLEL_MIN_SIMS:
+        from _sim_kernels import simulate_all
+        paths = np.empty((n_sims, years + 1))
+        simulate_all(paths, flips, initial, up, down, n_sims, years)
+        return paths
+
+    # The ahead-of-time kernel is serial but has no JIT cost at all
+    if SIM_NATIVE_AVAILABLE:
+        return sim_native.simulate_all(float(initial), up, down, flips)
+
+    paths = np.empty((n_sims, years + 1))
+    paths[:, 0] = initial
+
+    # Look the multiplier up by flip (index 0 = tails, 1 = heads)
+    factors = np.array([down, up])
+    paths[:, 1:] = factors[flips]
+
+    # Each year's balance is the running product of the yearly multipliers,
+    # accumulated from the initial balance so rounding matches the year-by-year loop
+    np.cumprod(paths, axis=1, out=paths)
+
+    return paths
+
+
+def run_simulations(flips, initial, up, down, age_start=25):
+    """
+    Run one simulation per row of coin flips
+    """
+    years = flips.shape[1]
+    return SimResults(flips=flips, ages=np.arange(age_start, age_start + years + 1),
+                      initial=initial, up=up, down=down)
+
+
+def log_outcome_balances(initial, years, up, down):
+    """
+    Log of the final balance for every number of heads 0..years.
+    Adding logs instead of multiplying cannot underflow to zero over long horizons
+    """
+    heads = np.arange(years + 1)
+    return np.log(initial) + heads * np.log(up) + (years - heads) * np.log(down)
+
+
+def closed_form_distribution(initial, years, up, down):
+    """
+    Exact distribution of the final balance, no simulation needed.
+    The number of heads is Binomial(years, 0.5) and the final balance is
+    initial * up^heads * down^(years - heads)
+    Returns every possible final balance (by number of heads) and its probability
+    """
+    probs = np.array([comb(years, h) for h in range(years + 1)]) / 2**years
+    balances = np.exp(log_outcome_balances(initial, years, up, down))
+    return balances, probs
+
+
+def log_margin(threshold, initial, years, up, down):
+    """
+    Log of (final balance / threshold) for every number of heads 0..years
+    """
+    return log_outcome_balances(initial, years, up, down) - np.log(threshold)
+
+
+def outcomes_above(threshold, initial, years, up, down):
+    """
+    Boolean mask over the number of heads (0..years): True where the final
+    balance ends strictly above the threshold
+    """
+    return log_margin(threshold, initial, years, up, down) > LOG_TOLERANCE
+
+
+def outcomes_below(threshold, initial, years, up, down):
+    """
+    Boolean mask over the number of heads (0..years): True where the final
+    balance ends strictly below the threshold
+    """
+    return log_margin(threshold, initial, years, up, down) < -LOG_TOLERANCE
+
+
+@dataclass
+class BalanceStats:
+    """
+    Summary of a set of final balances
+    """
+    min: float
+    max: float
+    median: float
+    mean: float
+    std: float
+    above_initial: int   # simulations ending above the initial balance
+    above_10000: int
+    above_100: int
+    below_100: int
+
+
+def summarize(results):
+    """
+    One sort gives min, max and median. Threshold counts are decided by the
+    number of heads, so break-even simulations never count as gains
+    """
+    sorted_balances = np.sort(results.final_balances)
+    n_sims = len(sorted_balances)
+    return BalanceStats(
+        min=sorted_balances[0],
+        max=sorted_balances[-1],
+        median=0.5 * (sorted_balances[(n_sims - 1) // 2] + sorted_balances[n_sims // 2]),
+        mean=sorted_balances.mean(),
+        std=sorted_balances.std(),
+        above_initial=results.count_above(results.initial),
+        above_10000=results.count_above(10000),
+        above_100=results.count_above(100),
+        below_100=results.count_below(100),
+    )
+
+
+@dataclass
+class ExactStats:
+    """
+    Exact summary of the final balance from its closed-form distribution
+    """
+    mean: float
+    median: float
+    std: float
+    prob_above_initial: float
+    prob_above_10000: float
+
+
+def exact_summary(initial, years, up, down):
+    """
+    Exact values from the binomial distribution of heads, to expose the sampling error
+    """
+    balances, probs = closed_form_distribution(initial, years, up, down)
+    mean = np.sum(probs * balances)
+    return ExactStats(
+        mean=mean,
+        median=balances[np.searchsorted(np.cumsum(probs), 0.5)],
+        std=np.sqrt(np.sum(probs * (balances - mean)**2)),
+        # Decided by the number of heads, so break-even outcomes never count as gains
+        prob_above_initial=probs[outcomes_above(initial, initial, years, up, down)].sum(),
+        prob_above_10000=probs[outcomes_above(10000, initial, years, up, down)].sum(),
+    )
+
+
+if __name__ == '__main__':
+    # Regression check: paths must not depend on the dtype of the flips
+    # (int64 flips used to crash the native kernel)
+    flips = np.random.default_rng(0).integers(0, 2, size=(100, 30))
+    expected = run_simulations(flips.astype(np.int8), 1000, 1.5, 0.6).paths
+    for dtype in (np.int64, bool):
+        paths = run_simulations(flips.astype(dtype), 1000, 1.5, 0.6).paths
+        assert np.allclose(paths, expected), dtype
+    print("simulate_paths: int8, int64 and bool flips agree")
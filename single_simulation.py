@@ -1,9 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
-import pandas as pd
 
 # Set seed for reproducibility
-np.random.seed(42)
+rng = np.random.default_rng(42)
 
 # Parameters
 initial_balance = 1000
@@ -12,21 +11,26 @@ age_end = 55    # Ending age
 years = age_end - age_start
 
 # Simulate one path of the investment game
-def simulate_investment_game(initial, years):
+def simulate_investment_game(initial, years, age_start=25, rng=None):
     """
     Simulate the investment game for a given number of years.
     Heads (50%): multiply by 1.5
     Tails (50%): multiply by 0.6
+    Pass rng to control the coin flips (a fresh unseeded generator is used otherwise)
     """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    ages = np.arange(age_start, age_start + years + 1)
     balance = initial
-    path = [initial]
-    ages = [age_start]
-    coin_flips = []
+    path = np.empty(years + 1)
+    path[0] = initial
+    coin_flips = np.empty(years, dtype=np.int8)
     
     for year in range(years):
         # Flip coin (1 = heads, 0 = tails)
-        coin_flip = np.random.binomial(1, 0.5)
-        coin_flips.append(coin_flip)
+        coin_flip = rng.integers(0, 2, dtype=np.int8)
+        coin_flips[year] = coin_flip
         
         # Update balance based on coin flip
         if coin_flip == 1:  # Heads
@@ -34,26 +38,18 @@ def simulate_investment_game(initial, years):
         else:  # Tails
             balance = balance * 0.6
             
-        path.append(balance)
-        ages.append(age_start + year + 1)
+        path[year + 1] = balance
     
     return ages, path, coin_flips
 
 # Run simulation
-ages, balances, flips = simulate_investment_game(initial_balance, years)
-
-# Create data frame for analysis
-sim_data = pd.DataFrame({
-    'age': ages,
-    'balance': balances,
-    'year': range(len(ages))
-})
+ages, balances, flips = simulate_investment_game(initial_balance, years, age_start, rng)
 
 # Create object-oriented matplotlib plot
 fig, ax = plt.subplots(figsize=(12, 8))
 
 # Plot the balance over time
-ax.plot(sim_data['age'], sim_data['balance'], 
+ax.plot(ages, balances, 
         color='darkblue', linewidth=2.5, marker='o', markersize=6,
         label='Account Balance')
 
@@ -61,10 +57,6 @@ ax.plot(sim_data['age'], sim_data['balance'],
 ax.axhline(y=initial_balance, color='red', linestyle='--', linewidth=2, 
            alpha=0.7, label='Initial Balance ($1,000)')
 
-# Add horizontal line for break-even
-ax.axhline(y=initial_balance, color='green', linestyle=':', linewidth=2, 
-           alpha=0.7, label='Break-even Point')
-
 # Customize the plot
 ax.set_title('Investment Game: Account Balance Over Time\nSingle Simulation Path', 
              fontsize=16, fontweight='bold', pad=20)
@@ -96,44 +88,49 @@ ax.annotate(f'Final Balance: ${final_balance:,.2f}',
 plt.tight_layout()
 plt.show()
 
-# Print detailed results
-print("="*60)
-print("SINGLE SIMULATION RESULTS")
-print("="*60)
-print(f"Initial Balance: ${initial_balance:,.2f}")
-print(f"Final Balance: ${final_balance:,.2f}")
-print(f"Total Return: ${final_balance - initial_balance:,.2f}")
-print(f"Percentage Return: {((final_balance / initial_balance) - 1) * 100:.2f}%")
-print(f"Number of Heads: {sum(flips)} out of {len(flips)} flips")
-print(f"Number of Tails: {len(flips) - sum(flips)} out of {len(flips)} flips")
-print(f"Head Percentage: {sum(flips)/len(flips)*100:.1f}%")
+# Print detailed results (collected first and written to stdout in one go)
+lines = []
+lines.append("="*60)
+lines.append("SINGLE SIMULATION RESULTS")
+lines.append("="*60)
+lines.append(f"Initial Balance: ${initial_balance:,.2f}")
+lines.append(f"Final Balance: ${final_balance:,.2f}")
+lines.append(f"Total Return: ${final_balance - initial_balance:,.2f}")
+lines.append(f"Percentage Return: {((final_balance / initial_balance) - 1) * 100:.2f}%")
+lines.append(f"Number of Heads: {flips.sum()} out of {len(flips)} flips")
+lines.append(f"Number of Tails: {len(flips) - flips.sum()} out of {len(flips)} flips")
+lines.append(f"Head Percentage: {flips.sum()/len(flips)*100:.1f}%")
 
 # Show the path
-print("\nYear-by-Year Results:")
-print("-" * 40)
+lines.append("\nYear-by-Year Results:")
+lines.append("-" * 40)
 for i, (age, balance) in enumerate(zip(ages, balances)):
     if i == 0:
-        print(f"Age {age}: ${balance:,.2f} (Initial)")
+        lines.append(f"Age {age}: ${balance:,.2f} (Initial)")
     else:
         outcome = "Heads (+50%)" if flips[i-1] == 1 else "Tails (-40%)"
-        print(f"Age {age}: ${balance:,.2f} ({outcome})")
+        lines.append(f"Age {age}: ${balance:,.2f} ({outcome})")
 
-print("\n" + "="*60)
-print("ANALYSIS")
-print("="*60)
+lines.append("\n" + "="*60)
+lines.append("ANALYSIS")
+lines.append("="*60)
 
 if final_balance > initial_balance:
-    print("✅ RESULT: PROFITABLE!")
-    print(f"   You gained ${final_balance - initial_balance:,.2f} over {years} years")
-    print("   This simulation was lucky - you got more heads than tails")
+    lines.append("✅ RESULT: PROFITABLE!")
+    lines.append(f"   You gained ${final_balance - initial_balance:,.2f} over {years} years")
+    lines.append("   This simulation was lucky - you got more heads than tails")
 else:
-    print("❌ RESULT: LOSS!")
-    print(f"   You lost ${initial_balance - final_balance:,.2f} over {years} years")
-    print("   This simulation was unlucky - you got more tails than heads")
+    lines.append("❌ RESULT: LOSS!")
+    lines.append(f"   You lost ${initial_balance - final_balance:,.2f} over {years} years")
+    lines.append("   This simulation was unlucky - you got more tails than heads")
 
-print(f"\nExpected value per year: ${initial_balance * 0.05:,.2f}")
-print(f"Actual average per year: ${(final_balance - initial_balance) / years:,.2f}")
+lines.append(f"\nExpected value per year: ${initial_balance * 0.05:,.2f}")
+lines.append(f"Actual average per year: ${(final_balance - initial_balance) / years:,.2f}")
 
 # Show the data
-print("\nDetailed Data:")
-print(sim_data.round(2))
+lines.append("\nDetailed Data:")
+lines.append(f"{'Age':>3} {'Balance':>10} {'Year':>4}")
+for year, (age, balance) in enumerate(zip(ages, balances)):
+    lines.append(f"{age:3d} {balance:10,.2f} {year:4d}")
+
+print("\n".join(lines))